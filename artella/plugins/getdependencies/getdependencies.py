@@ -8,16 +8,260 @@ Module that contains Artella Get Dependencies plugin implementation
 from __future__ import print_function, division, absolute_import
 
 import os
+import re
+import stat
 import logging
+from collections import deque
+from concurrent import futures
+from functools import lru_cache
+from itertools import chain
 
 from artella import dcc, api
 from artella.core.dcc import parser
 from artella.core import plugin, utils, downloader
-from artella.plugins.getdependencies.widgets import listdialog, outputdialog
 
 logger = logging.getLogger('artella')
 
 
+def _bulk_path_types(paths):
+    """
+    Returns a dictionary mapping each of the given absolute paths to 'file', 'dir' or None.
+
+    Directories are listed only once using os.scandir, so classifying many paths that live in the same
+    directory costs roughly one system call per directory instead of one stat call per path, and the
+    file/directory decision comes from a single scan instead of paired isfile/isdir stats.
+
+    The name lookup against the scan results is an exact string match, which can miss entries on
+    case-insensitive file systems when the recorded case differs from the on-disk one, so any path the
+    scan did not match is confirmed with a direct per-path check before being reported as missing.
+
+    :param list(str) paths: List of absolute paths to classify.
+    :return: Dictionary mapping each given path to 'file' if it is an existing file, 'dir' if it is an
+        existing directory and None if it does not exist.
+    :rtype: dict(str, str or None)
+    """
+
+    scan_fn = getattr(os, 'scandir', None)
+
+    dir_entries = dict()
+    types_map = dict()
+    dirname = os.path.dirname
+    basename = os.path.basename
+    for path in paths:
+        if not path:
+            types_map[path] = None
+            continue
+        dir_name = dirname(path)
+        entries = dir_entries.get(dir_name, None)
+        if entries is None:
+            files_in_dir = set()
+            dirs_in_dir = set()
+            try:
+                if scan_fn:
+                    for entry in scan_fn(dir_name):
+                        if entry.is_file():
+                            files_in_dir.add(entry.name)
+                        elif entry.is_dir():
+                            dirs_in_dir.add(entry.name)
+                else:
+                    for entry_name in os.listdir(dir_name):
+                        try:
+                            entry_mode = os.stat(os.path.join(dir_name, entry_name)).st_mode
+                        except OSError:
+                            continue
+                        if stat.S_ISREG(entry_mode):
+                            files_in_dir.add(entry_name)
+                        elif stat.S_ISDIR(entry_mode):
+                            dirs_in_dir.add(entry_name)
+            except OSError:
+                pass
+            entries = (files_in_dir, dirs_in_dir)
+            dir_entries[dir_name] = entries
+        path_name = basename(path)
+        if path_name in entries[0]:
+            types_map[path] = 'file'
+        elif path_name in entries[1]:
+            types_map[path] = 'dir'
+        elif _fast_isfile(path):
+            types_map[path] = 'file'
+        elif _fast_isdir(path):
+            types_map[path] = 'dir'
+        else:
+            types_map[path] = None
+
+    return types_map
+
+
+_MAYA_EXTS = frozenset(('ma', 'mb'))
+_DCC_EXTS = None
+
+# Maps each parsed file path to a (mtime, parsed dependencies) tuple. Keeping only the newest entry per
+# path bounds the cache to one result per file, so re-saving a scene replaces its entry instead of
+# stranding the previous one for the rest of the session.
+_parse_cache = dict()
+
+
+def _local_file_names(local_directory):
+    """
+    Returns the names of the files found under the given local directory using a single directory scan.
+
+    :param str local_directory: Absolute local directory path to list.
+    :return: List of file names found under the given directory.
+    :rtype: list(str)
+    """
+
+    scan_fn = getattr(os, 'scandir', None)
+    try:
+        if scan_fn:
+            return [entry.name for entry in scan_fn(local_directory) if entry.is_file(follow_symlinks=False)]
+        return [
+            entry_name for entry_name in os.listdir(local_directory)
+            if os.path.isfile(os.path.join(local_directory, entry_name))]
+    except OSError:
+        return list()
+
+
+def _remote_file_names(directory_info):
+    """
+    Returns the names of the remote files contained in the given Artella directory status dictionary.
+
+    :param dict directory_info: Status dictionary returned by api.file_status for one directory.
+    :return: List of remote file names found in the given status.
+    :rtype: list(str)
+    """
+
+    file_names = list()
+    for handle, data in directory_info.items():
+        remote_info = data.get('remote_info', dict())
+        is_file = remote_info.get('raw', dict()).get('type', None) == 'file'
+        name = remote_info.get('name', None)
+        if is_file and name:
+            file_names.append(name)
+    return file_names
+
+
+if os.name == 'nt':
+    import ctypes
+
+    _INVALID_FILE_ATTRIBUTES = -1
+    _FILE_ATTRIBUTE_DIRECTORY = 0x10
+
+    def _fast_isfile(path):
+        """
+        Windows fast-path isfile check that resolves file attributes with a single Win32 call instead of the
+        full stat emulation os.path.isfile goes through.
+
+        :param str path: Absolute path to check.
+        :return: True if path points to an existing file; False otherwise.
+        :rtype: bool
+        """
+
+        attributes = ctypes.windll.kernel32.GetFileAttributesW(path)
+        return attributes != _INVALID_FILE_ATTRIBUTES and not attributes & _FILE_ATTRIBUTE_DIRECTORY
+
+    def _fast_isdir(path):
+        """
+        Windows fast-path isdir check that resolves file attributes with a single Win32 call instead of the
+        full stat emulation os.path.isdir goes through.
+
+        :param str path: Absolute path to check.
+        :return: True if path points to an existing directory; False otherwise.
+        :rtype: bool
+        """
+
+        attributes = ctypes.windll.kernel32.GetFileAttributesW(path)
+        return attributes != _INVALID_FILE_ATTRIBUTES and bool(attributes & _FILE_ATTRIBUTE_DIRECTORY)
+else:
+    _fast_isfile = os.path.isfile
+    _fast_isdir = os.path.isdir
+
+
+def _dcc_extensions():
+    """
+    Returns the set of lower-cased extensions (without leading dot) supported by the current DCC.
+
+    The set is built from dcc.extensions() on first use and cached for the lifetime of the process.
+
+    :return: Set of supported extensions.
+    :rtype: frozenset(str)
+    """
+
+    global _DCC_EXTS
+    if _DCC_EXTS is None:
+        _DCC_EXTS = frozenset(ext.lstrip('.').lower() for ext in dcc.extensions() or list())
+    return _DCC_EXTS
+
+
+@lru_cache(maxsize=4096)
+def _clean_path(path):
+    """
+    Memoized wrapper over utils.clean_path.
+
+    Path cleanup is a pure string transformation that gets applied to the same dependency paths over and
+    over across traversal levels, so results are cached with a bounded LRU cache.
+
+    :param str path: Path to clean.
+    :return: Cleaned path.
+    :rtype: str
+    """
+
+    return utils.clean_path(path)
+
+
+@lru_cache(maxsize=512)
+def _udim_regex(dep_file_name, dep_file_ext):
+    """
+    Returns a compiled regular expression that matches the tile file names of the given UDIM dependency.
+
+    The <UDIM> token becomes a digits group and every other part of the name is escaped literally. Patterns
+    are cached so textures shared across scans compile their matcher only once.
+
+    :param str dep_file_name: UDIM dependency file name, without extension.
+    :param str dep_file_ext: UDIM dependency file extension, including leading dot.
+    :return: Compiled regular expression matching the tiles of the given dependency.
+    :rtype: re.Pattern
+    """
+
+    return re.compile('^{}{}$'.format(
+        '_'.join(
+            '(\\d+)' if dep_part == '<UDIM>' else re.escape(dep_part) for dep_part in dep_file_name.split('_')),
+        re.escape(dep_file_ext)))
+
+
+def _bulk_translate(paths):
+    """
+    Translates the given paths into local user paths, using one batched API call when available.
+
+    :param list(str) paths: List of paths to translate.
+    :return: Dictionary mapping each given path to its translated local path.
+    :rtype: dict(str, str)
+    """
+
+    paths = list(paths)
+    translate_paths_fn = getattr(api, 'translate_paths', None)
+    if translate_paths_fn and len(paths) > 1:
+        try:
+            translated_paths = translate_paths_fn(paths)
+            if translated_paths and len(translated_paths) == len(paths):
+                return dict(zip(paths, translated_paths))
+        except Exception:
+            logger.debug('Batched path translation failed. Falling back to per path translation', exc_info=True)
+
+    return dict((path, api.translate_path(path)) for path in paths)
+
+
+def _bulk_isfile(paths):
+    """
+    Returns a dictionary mapping each of the given absolute paths to whether that path is an existing file.
+
+    :param list(str) paths: List of absolute file paths to check.
+    :return: Dictionary mapping each given path to True if the path points to an existing file; False otherwise.
+    :rtype: dict(str, bool)
+    """
+
+    return dict((path, path_type == 'file') for path, path_type in _bulk_path_types(paths).items())
+
+
 class GetDependenciesPlugin(plugin.ArtellaPlugin, object):
 
     ID = 'artella-plugins-getdependencies'
@@ -26,6 +270,20 @@ class GetDependenciesPlugin(plugin.ArtellaPlugin, object):
     def __init__(self, config_dict=None, manager=None):
         super(GetDependenciesPlugin, self).__init__(config_dict=config_dict, manager=manager)
 
+        self._parser = None
+
+    def _get_parser(self):
+        """
+        Returns the parser instance used by this plugin, creating it on first use.
+
+        :return: Parser instance used to retrieve dependencies from DCC files.
+        :rtype: parser.Parser
+        """
+
+        if self._parser is None:
+            self._parser = parser.Parser()
+        return self._parser
+
     @utils.timestamp
     def get_dependencies(self, file_path=None, recursive=True, update_paths=False, show_dialogs=True):
         """
@@ -58,51 +316,47 @@ class GetDependenciesPlugin(plugin.ArtellaPlugin, object):
                     logger.warning(msg)
                 return dependencies
 
+        caches = {'translate': dict(), 'latest': dict(), 'isfile': dict()}
+
+        cleaned_paths = [_clean_path(file_path) for file_path in file_paths if file_path]
+        translate_map = _bulk_translate(cleaned_paths)
         local_paths = list()
-        for file_path in file_paths:
-            if not file_path:
-                continue
-            file_path = utils.clean_path(file_path)
-            local_path = api.translate_path(file_path)
+        valid_paths = list()
+        for file_path in cleaned_paths:
+            local_path = translate_map[file_path]
+            caches['translate'][file_path] = local_path
             local_paths.append(local_path)
+            if file_path.rpartition('.')[2].lower() in _MAYA_EXTS:
+                valid_paths.append(local_path)
         if not local_paths:
             return dependencies
 
         files_to_download = list()
+        local_isfile_map = _bulk_isfile(local_paths)
         for file_path in local_paths:
-            if not os.path.isfile(file_path):
+            if not local_isfile_map[file_path]:
                 files_to_download.append(file_path)
         if files_to_download:
             dcc_downloader = downloader.Downloader()
             dcc_downloader.download(files_to_download, show_dialogs=show_dialogs)
 
-        valid_paths = list()
-        for path in local_paths:
-            file_ext = os.path.splitext(file_path)[-1]
-            if file_ext not in ('.ma', '.mb'):
-                continue
-            valid_paths.append(path)
         if not valid_paths:
             return dependencies
 
-        dcc_parser = parser.Parser()
-        base_dependencies = dcc_parser.parse(local_paths)
+        dcc_parser = self._get_parser()
+        base_dependencies = dcc_parser.parse(valid_paths)
         if not base_dependencies:
             return dependencies
 
-        self._get_dependencies(base_dependencies, dependencies, show_dialogs=show_dialogs, recursive=recursive)
+        files_updated = list()
+        self._get_dependencies(
+            base_dependencies, dependencies, show_dialogs=show_dialogs, recursive=recursive, caches=caches,
+            files_updated=files_updated)
 
         if update_paths:
-            files_to_update = list(set(dependencies))
-            api.update_paths(files_to_update, show_dialogs=show_dialogs, call_post_function=False)
+            api.update_paths(list(dependencies), show_dialogs=show_dialogs, call_post_function=False)
 
-        files_updated = list()
-        for dependencies_files in list(dependencies.values()):
-            for path in dependencies_files:
-                if not path or not os.path.isfile(path):
-                    continue
-                files_updated.append(path)
-        self._post_get_dependencies(files_updated=files_updated)
+        self._post_get_dependencies(files_updated)
 
         api.show_success_message('Get Dependencies operation was successful!', title='Get Dependencies')
 
@@ -133,43 +387,57 @@ class GetDependenciesPlugin(plugin.ArtellaPlugin, object):
 
         if not file_path:
             file_path = dcc.scene_name()
-        if not file_path or not os.path.isfile(file_path):
+        if not file_path or not _fast_isfile(file_path):
             api.show_warning_message(
                 'Unable to get available non available dependencies. Given scene file does not exists!'.format(
                     file_path))
             return non_available_deps
 
-        dcc_parser = parser.Parser()
+        dcc_parser = self._get_parser()
         deps_file_paths = dcc_parser.parse([file_path], show_dialogs=True) or dict()
         if not deps_file_paths:
             return non_available_deps
 
-        for parent_path, dep_file_paths in deps_file_paths.items():
-            for dep_file_path in dep_file_paths:
-                if dcc.is_udim_path(dep_file_path):
-                    non_available_deps.append(self._get_path_from_udim(dep_file_path))
-                else:
-                    translated_path = api.translate_path(dep_file_path)
-                    if translated_path and not os.path.isfile(translated_path):
-                        if os.path.isdir(translated_path):
-                            continue
-                        file_ext = os.path.splitext(translated_path)
-                        if not file_ext[-1]:
-                            continue
-                        non_available_deps.append(translated_path)
+        translated_paths = list()
+        udim_file_paths = list()
+        remote_dir_cache = dict()
+        translate_path = api.translate_path
+        is_udim_path = dcc.is_udim_path
+        splitext = os.path.splitext
+        for dep_file_path in chain.from_iterable(deps_file_paths.values()):
+            if is_udim_path(dep_file_path):
+                udim_file_paths.append(dep_file_path)
+            else:
+                if not splitext(dep_file_path)[1]:
+                    continue
+                translated_path = translate_path(dep_file_path)
+                if translated_path:
+                    translated_paths.append(translated_path)
+        if udim_file_paths:
+            self._prefetch_udim_directories(udim_file_paths, remote_dir_cache)
+            for dep_file_path in udim_file_paths:
+                non_available_deps.append(self._get_path_from_udim(dep_file_path, remote_cache=remote_dir_cache))
+        translated_types_map = _bulk_path_types(translated_paths)
+        for translated_path in translated_paths:
+            if translated_types_map[translated_path] is not None:
+                continue
+            non_available_deps.append(translated_path)
 
         deps_retrieved = list()
         if non_available_deps:
 
             clean_non_available_deps = list()
+            seen_deps = set()
             for dep in non_available_deps:
                 if not dep:
                     continue
-                if isinstance(dep, (list, tuple)):
-                    clean_non_available_deps.extend(dep)
-                else:
-                    clean_non_available_deps.append(dep)
-            non_available_deps = list(tuple(clean_non_available_deps))
+                dep_paths = dep if isinstance(dep, (list, tuple)) else (dep,)
+                for dep_path in dep_paths:
+                    if not dep_path or dep_path in seen_deps:
+                        continue
+                    seen_deps.add(dep_path)
+                    clean_non_available_deps.append(dep_path)
+            non_available_deps = clean_non_available_deps
 
             api.show_info_message(
                 '{} Missing dependencies found.'.format(len(non_available_deps)), title='Artella - Get Dependencies')
@@ -203,6 +471,8 @@ class GetDependenciesPlugin(plugin.ArtellaPlugin, object):
         :return: True if the user acceps the operation; False otherwise
         """
 
+        from artella.plugins.getdependencies.widgets import listdialog
+
         deps_dialog = listdialog.DependenciesListDialog()
         title = 'Artella - Missing dependency' if len(deps) <= 1 else 'Artella - Missing dependencies'
         deps_dialog.setWindowTitle(title)
@@ -215,111 +485,242 @@ class GetDependenciesPlugin(plugin.ArtellaPlugin, object):
         if not deps_list:
             return
 
-        deps_dialog = outputdialog.DependenciesOutputDialog()
+        from artella.plugins.getdependencies.widgets import outputdialog
+
+        deps_dialog = outputdialog.DependenciesOutputDialog.get_or_create()
+        dependency_pairs = list()
         for dep in deps_list:
             for dep_parent_path, dep_paths in dep.items():
                 if dep_paths:
                     for dep_path in dep_paths:
-                        deps_dialog.add_dependency(dep_path, dep_parent_path)
+                        dependency_pairs.append((dep_path, dep_parent_path))
                 else:
-                    deps_dialog.add_dependency(dep_parent_path, None)
+                    dependency_pairs.append((dep_parent_path, None))
         deps_dialog.show()
-
-    def _get_dependencies(self, dependency_files, dependencies_, show_dialogs=True, recursive=True):
-        files_to_download = list()
-        parent_maps = dict()
-        for parent_path, dependencies in dependency_files.items():
-            dependencies_.setdefault(parent_path, list())
-            for dependency_file in dependencies:
-                dependency_file = utils.clean_path(dependency_file)
-                local_path = api.translate_path(dependency_file)
-                if not os.path.isfile(local_path):
-                    files_to_download.append(local_path)
-                    parent_maps[local_path] = parent_path
+        deps_dialog.populate_async(dependency_pairs)
+
+    def _get_dependencies(
+            self, dependency_files, dependencies_, show_dialogs=True, recursive=True, caches=None,
+            files_updated=None):
+        if caches is None:
+            caches = {'translate': dict(), 'latest': dict(), 'isfile': dict()}
+        if files_updated is None:
+            files_updated = list()
+        files_updated_set = set(files_updated)
+        translate_cache = caches['translate']
+        latest_cache = caches['latest']
+        isfile_cache = caches['isfile']
+
+        dcc_extensions = _dcc_extensions()
+        file_is_latest_version = api.file_is_latest_version
+        parsed_files = set()
+        visited = set()
+
+        queue = deque()
+        queue.append(dependency_files)
+        while queue:
+            dependency_files = queue.popleft()
+            files_to_download = list()
+            files_to_download_set = set()
+            parent_maps = dict()
+            local_paths = list()
+            dependency_pairs = list()
+            for parent_path, dependencies in dependency_files.items():
+                dependencies_.setdefault(parent_path, list())
+                for dependency_file in dependencies:
+                    dependency_pairs.append((parent_path, _clean_path(dependency_file)))
+            paths_to_translate = list()
+            paths_to_translate_set = set()
+            for _, dependency_file in dependency_pairs:
+                if dependency_file not in translate_cache and dependency_file not in paths_to_translate_set:
+                    paths_to_translate_set.add(dependency_file)
+                    paths_to_translate.append(dependency_file)
+            translate_cache.update(_bulk_translate(paths_to_translate))
+            for parent_path, dependency_file in dependency_pairs:
+                local_paths.append((parent_path, translate_cache[dependency_file]))
+            isfile_cache.update(
+                _bulk_isfile([local_path for _, local_path in local_paths if local_path not in isfile_cache]))
+            for parent_path, local_path in local_paths:
+                if local_path in visited:
+                    dependencies_[parent_path].append(local_path)
+                    continue
+                visited.add(local_path)
+                if not isfile_cache[local_path]:
+                    if local_path not in files_to_download_set:
+                        files_to_download_set.add(local_path)
+                        files_to_download.append(local_path)
+                    parent_maps.setdefault(local_path, list()).append(parent_path)
                 else:
-                    is_latest_version = api.file_is_latest_version(local_path)
+                    if local_path in latest_cache:
+                        is_latest_version = latest_cache[local_path]
+                    else:
+                        latest_cache[local_path] = is_latest_version = file_is_latest_version(local_path)
                     if not is_latest_version:
-                        files_to_download.append(local_path)
-                        parent_maps[local_path] = parent_path
+                        if local_path not in files_to_download_set:
+                            files_to_download_set.add(local_path)
+                            files_to_download.append(local_path)
+                        parent_maps.setdefault(local_path, list()).append(parent_path)
                     else:
                         dependencies_[parent_path].append(local_path)
-        if files_to_download:
-            dcc_downloader = downloader.Downloader()
-            dcc_downloader.download(files_to_download, show_dialogs=show_dialogs)
+                        if local_path not in files_updated_set:
+                            files_updated_set.add(local_path)
+                            files_updated.append(local_path)
+            if files_to_download:
+                dcc_downloader = downloader.Downloader()
+                dcc_downloader.download(files_to_download, show_dialogs=show_dialogs)
+
+            files_to_parse = list()
+            isfile_cache.update(_bulk_isfile(files_to_download))
+            for downloaded_file in files_to_download:
+                for parent_path in parent_maps[downloaded_file]:
+                    dependencies_[parent_path].append(downloaded_file)
+                if not isfile_cache[downloaded_file]:
+                    continue
+                if downloaded_file not in files_updated_set:
+                    files_updated_set.add(downloaded_file)
+                    files_updated.append(downloaded_file)
+                if downloaded_file in parsed_files:
+                    continue
+                file_ext = downloaded_file.rpartition('.')[2].lower()
+                if file_ext not in dcc_extensions:
+                    continue
+                files_to_parse.append(downloaded_file)
 
-        files_to_parse = list()
-        for downloaded_file in files_to_download:
-            parent_path = parent_maps[downloaded_file]
-            dependencies_[parent_path].append(downloaded_file)
-            if not os.path.isfile(downloaded_file):
-                continue
-            file_ext = os.path.splitext(os.path.basename(downloaded_file))[-1]
-            if file_ext not in dcc.extensions():
-                continue
-            files_to_parse.append(downloaded_file)
+            if files_to_parse and recursive:
+                parsed_files.update(files_to_parse)
+                deps_file_paths = self._parse_files(files_to_parse, show_dialogs=show_dialogs)
+                if deps_file_paths:
+                    queue.append(deps_file_paths)
+
+    def _parse_files(self, file_paths, show_dialogs=True):
+        """
+        Internal function that parses the given DCC files and returns all the dependency files found on them.
 
-        if files_to_parse and recursive:
+        Files are parsed concurrently in a thread pool, with one parser instance per task, so parsers that
+        spawn subprocesses can overlap their wait time.
+
+        :param list(str) file_paths: List of absolute local file paths to parse.
+        :param bool show_dialogs: Whether UI dialogs should appear or not.
+        :return: Dictionary mapping each parsed file with the dependency files found on it.
+        :rtype: dict(str, list(str))
+        """
+
+        force_mayapy_parser = dcc.is_maya()
+
+        def _parse(file_path):
+            try:
+                file_mtime = os.path.getmtime(file_path)
+            except OSError:
+                file_mtime = None
+            cached_entry = _parse_cache.get(file_path, None)
+            if file_mtime is not None and cached_entry is not None and cached_entry[0] == file_mtime:
+                return cached_entry[1]
             dcc_parser = parser.Parser()
-            if dcc.is_maya():
-                deps_file_paths = dcc_parser.parse(
-                    files_to_parse, show_dialogs=show_dialogs, force_mayapy_parser=True) or dict()
+            if force_mayapy_parser:
+                parsed_deps = dcc_parser.parse(
+                    [file_path], show_dialogs=show_dialogs, force_mayapy_parser=True) or dict()
             else:
-                deps_file_paths = dcc_parser.parse(files_to_parse, show_dialogs=show_dialogs) or dict()
-            if deps_file_paths:
-                self._get_dependencies(deps_file_paths, dependencies_, show_dialogs=show_dialogs)
+                parsed_deps = dcc_parser.parse([file_path], show_dialogs=show_dialogs) or dict()
+            if file_mtime is not None:
+                _parse_cache[file_path] = (file_mtime, parsed_deps)
+            return parsed_deps
+
+        deps_file_paths = dict()
+        if len(file_paths) == 1:
+            deps_file_paths.update(_parse(file_paths[0]))
+            return deps_file_paths
 
-    def _get_path_from_udim(self, dep_file_path):
+        with futures.ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+            for parsed_deps in executor.map(_parse, file_paths):
+                for parent_path, parsed_files in parsed_deps.items():
+                    deps_file_paths.setdefault(parent_path, list()).extend(parsed_files)
 
-        remote_path_files = dict()
+        return deps_file_paths
+
+    def _prefetch_udim_directories(self, udim_file_paths, remote_cache):
+        """
+        Internal function that fills the given listing cache for all folders of the given UDIM dependencies.
+
+        Locally synced folders are listed from disk with one directory scan each, and every remaining folder
+        is queried through a single batched api.file_status call instead of one round trip per folder.
+
+        :param list(str) udim_file_paths: List of UDIM dependency file paths.
+        :param dict remote_cache: Cache mapping each folder directory with the file names found on it.
+        """
+
+        pending_dirs = list()
+        pending_dirs_set = set()
+        dirname = os.path.dirname
+        for dep_file_path in udim_file_paths:
+            folder_directory = dirname(dep_file_path)
+            if folder_directory in remote_cache or folder_directory in pending_dirs_set:
+                continue
+            local_directory = api.translate_path(folder_directory)
+            if local_directory and _fast_isdir(local_directory):
+                remote_cache[folder_directory] = _local_file_names(local_directory)
+            else:
+                pending_dirs_set.add(folder_directory)
+                pending_dirs.append(folder_directory)
+        if len(pending_dirs) <= 1:
+            return
+
+        try:
+            directory_infos = api.file_status(pending_dirs, include_remote=True) or list()
+        except Exception:
+            logger.debug('Batched directory status failed. Falling back to per directory status', exc_info=True)
+            return
+        if len(directory_infos) != len(pending_dirs):
+            return
+        for folder_directory, directory_info in zip(pending_dirs, directory_infos):
+            remote_cache[folder_directory] = _remote_file_names(directory_info) if directory_info else list()
+
+    def _get_path_from_udim(self, dep_file_path, remote_cache=None):
+
+        remote_path_files = remote_cache if remote_cache is not None else dict()
 
         udim_dependencies = list()
 
         folder_directory = os.path.dirname(dep_file_path)
         dep_file_name, dep_file_ext = os.path.splitext(os.path.basename(dep_file_path))
-        dep_file_parts = dep_file_name.split('_')
+        if folder_directory not in remote_path_files:
+            local_directory = api.translate_path(folder_directory)
+            if local_directory and _fast_isdir(local_directory):
+                remote_path_files[folder_directory] = _local_file_names(local_directory)
         if folder_directory not in remote_path_files:
             directory_info = api.file_status(folder_directory, include_remote=True) or None
             if not directory_info:
                 remote_path_files[folder_directory] = list()
             else:
-                directory_info = directory_info[0]
-                for handle, data in directory_info.items():
-                    remote_info = data.get('remote_info', dict())
-                    remote_path_files.setdefault(folder_directory, list())
-                    is_file = remote_info.get('raw', dict()).get('type', None) == 'file'
-                    name = remote_info.get('name', None)
-                    if is_file and name:
-                        remote_path_files[folder_directory].append(name)
-        if folder_directory in remote_path_files:
-            for directory_path, file_names in remote_path_files.items():
-                if not file_names:
+                remote_path_files[folder_directory] = _remote_file_names(directory_info[0])
+        file_names = remote_path_files.get(folder_directory, None)
+        if file_names:
+            translated_paths = list()
+            udim_regex = _udim_regex(dep_file_name, dep_file_ext)
+            for file_name in file_names:
+                if not udim_regex.match(file_name):
                     continue
-                for file_name in file_names:
-                    valid = True
-                    file_parts = file_name.split('_')
-                    for dep_part, file_part in zip(dep_file_parts, file_parts):
-                        if dep_part == '<UDIM>':
-                            continue
-                        if dep_part != file_part:
-                            valid = False
-                            break
-                    if valid:
-                        udim_file_path = os.path.join(directory_path, file_name)
-                        translated_path = api.translate_path(udim_file_path)
-                        if translated_path and not os.path.isfile(translated_path):
-                            if os.path.isdir(translated_path):
-                                continue
-                            file_ext = os.path.splitext(translated_path)
-                            if not file_ext[-1]:
-                                continue
-                            udim_dependencies.append(translated_path)
+                udim_file_path = '{}/{}'.format(folder_directory, file_name)
+                translated_path = api.translate_path(udim_file_path)
+                if translated_path:
+                    translated_paths.append(translated_path)
+            translated_types_map = _bulk_path_types(translated_paths)
+            for translated_path in translated_paths:
+                if translated_types_map[translated_path] is not None:
+                    continue
+                file_ext = os.path.splitext(translated_path)
+                if not file_ext[-1]:
+                    continue
+                udim_dependencies.append(translated_path)
 
         return udim_dependencies
 
-    def _post_get_dependencies(self, **kwargs):
+    def _post_get_dependencies(self, files_updated=None):
         """
         Internal function that is called after get dependencies functionality is over. Can be override in custom DCC
         plugins.
+
+        :param list(str) or None files_updated: List of dependency file paths that were retrieved or confirmed
+            on disk during the operation.
         """
 
         pass
@@ -15,13 +15,16 @@ class GetDependenciesMayaPlugin(getdependencies.GetDependenciesPlugin, object):
     def __init__(self, config_dict=None, manager=None):
         super(GetDependenciesMayaPlugin, self).__init__(config_dict=config_dict, manager=manager)
 
-    def _post_get_dependencies(self, **kwargs):
+    def _post_get_dependencies(self, files_updated=None):
         """
         Internal function that is called after get dependencies functionality is over. Can be override in custom DCC
         plugins.
+
+        :param list(str) or None files_updated: List of dependency file paths that were retrieved or confirmed
+            on disk during the operation.
         """
 
-        files_updated = kwargs.get('files_updated', list())
+        files_updated = files_updated or list()
 
         maya_utils.reload_textures(files_updated)
         maya_utils.reload_dependencies(files_updated)
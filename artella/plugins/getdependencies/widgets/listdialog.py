@@ -13,8 +13,60 @@ from artella.core import qtutils, resource
 if qtutils.QT_AVAILABLE:
     from artella.externals.Qt import QtCore, QtWidgets, QtGui
 
+_WARNING_PIXMAP_CACHE = dict()
+_WARNING_SOURCE_PIXMAP = None
+
+
+def _warning_source_pixmap():
+    """
+    Returns the unscaled warning pixmap from the resources system, looking it up only once per process.
+
+    The resource lookup walks the registered resource paths and decodes the image file, so its result is
+    cached here and shared by every scaled variant that _warning_pixmap produces.
+
+    :return: Unscaled warning pixmap.
+    :rtype: QtGui.QPixmap
+    """
+
+    global _WARNING_SOURCE_PIXMAP
+    if _WARNING_SOURCE_PIXMAP is None:
+        _WARNING_SOURCE_PIXMAP = resource.pixmap('warning') or QtGui.QPixmap()
+    return _WARNING_SOURCE_PIXMAP
+
+
+def _warning_pixmap(size=(30, 30)):
+    """
+    Returns the warning icon pixmap scaled to the given size.
+
+    The scaled pixmap is cached per size, so the resource lookup and the scale run once per process
+    instead of once per dialog open. Scaling is skipped entirely when the source already matches the
+    requested size, and a fast transformation is used for near-size adjustments (within 4 pixels) where
+    smooth filtering makes no visible difference.
+
+    :param tuple(int, int) size: Width and height the returned pixmap should fit in.
+    :return: Scaled warning pixmap.
+    :rtype: QtGui.QPixmap
+    """
+
+    icon_pixmap = _WARNING_PIXMAP_CACHE.get(size, None)
+    if icon_pixmap is None:
+        icon_pixmap = _warning_source_pixmap()
+        width, height = size
+        if icon_pixmap.width() != width or icon_pixmap.height() != height:
+            if abs(icon_pixmap.width() - width) <= 4 and abs(icon_pixmap.height() - height) <= 4:
+                transform_mode = QtCore.Qt.FastTransformation
+            else:
+                transform_mode = QtCore.Qt.SmoothTransformation
+            icon_pixmap = icon_pixmap.scaled(
+                QtCore.QSize(width, height), QtCore.Qt.KeepAspectRatio, transformMode=transform_mode)
+        _WARNING_PIXMAP_CACHE[size] = icon_pixmap
+    return icon_pixmap
+
 
 class DependenciesListDialog(dialog.Dialog(), object):
+
+    FADE_ENABLED = True
+
     def __init__(self, parent=None, **kwargs):
 
         self._do_sync = False
@@ -43,7 +95,11 @@ class DependenciesListDialog(dialog.Dialog(), object):
         self.setWindowTitle('Dependencies Found')
 
         deps_lbl = QtWidgets.QLabel('One or more dependent files are missing: ')
-        self._deps_list = QtWidgets.QListWidget()
+        self._deps_model = QtCore.QStringListModel()
+        self._deps_list = QtWidgets.QListView()
+        self._deps_list.setModel(self._deps_model)
+        self._deps_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self._deps_list.setUniformItemSizes(True)
         cbx_lyt = QtWidgets.QHBoxLayout()
         deps2_lbl = QtWidgets.QLabel('Would you like to download all missing files?')
         self._recursive_cbx = QtWidgets.QCheckBox('Recursive?')
@@ -60,8 +116,7 @@ class DependenciesListDialog(dialog.Dialog(), object):
         warning_layout.setContentsMargins(0, 0, 0, 0)
         self._warning_frame.setLayout(warning_layout)
         warning_icon = QtWidgets.QLabel()
-        icon_pixmap = (resource.pixmap('warning') or QtGui.QPixmap()).scaled(
-            QtCore.QSize(30, 30), QtCore.Qt.KeepAspectRatio, transformMode=QtCore.Qt.SmoothTransformation)
+        icon_pixmap = _warning_pixmap()
         warning_message = QtWidgets.QLabel(
             'Recursive Get Dependencies can take quite a lot of time when working with big scenes!')
         warning_icon.setPixmap(icon_pixmap)
@@ -88,25 +143,35 @@ class DependenciesListDialog(dialog.Dialog(), object):
         self.resize(QtCore.QSize(350, 350))
 
     def set_dependencies(self, deps_list):
+        self._deps_model.setStringList([str(dep) for dep in deps_list or list()])
 
-        self._deps_list.clear()
-
-        if deps_list is None:
-            return
+    def _close_dialog(self):
+        """
+        Internal function that closes the dialog, fading it out only when fading is enabled and the
+        instance has not been flagged for a fast close.
+        """
 
-        for dep in deps_list:
-            self._deps_list.addItem(dep)
+        if self.FADE_ENABLED and not getattr(self, '_fast_close', False):
+            self.fade_close()
+        else:
+            self.close()
 
     def _on_ok(self):
         self._do_sync = True
         self._do_recursive = self._recursive_cbx.isChecked()
-        self.fade_close()
+        self._close_dialog()
 
     def _on_cancel(self):
         self._do_sync = False
         self._do_recursive = True
         self._recursive_cbx.setChecked(self._do_recursive)
-        self.fade_close()
+        self._close_dialog()
 
     def _on_toggle_check(self, flag):
-        self._warning_frame.setVisible(flag)
+        if self._warning_frame.isVisible() == bool(flag):
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            self._warning_frame.setVisible(flag)
+        finally:
+            self.setUpdatesEnabled(True)
@@ -8,6 +8,8 @@ Module that contains Artella Get Dependencies custom widgets
 from __future__ import print_function, division, absolute_import
 
 import os
+import weakref
+from functools import lru_cache
 
 from artella.core.dcc import dialog
 from artella.core import qtutils
@@ -16,10 +18,135 @@ if qtutils.QT_AVAILABLE:
     from artella.externals.Qt import QtCore, QtWidgets, QtGui
 
 
+_DIALOG_REF = None
+
+_BRUSH_FILE = None
+_BRUSH_MISSING = None
+
+
+def _row_brushes():
+    """
+    Returns the brushes used to color existing and missing dependency rows, creating them on first use.
+
+    The brushes are built lazily because Qt types should not be instantiated at import time, and cached so
+    bulk populations do not allocate a color and a brush per row.
+
+    :return: Tuple with the existing-file brush and the missing-file brush.
+    :rtype: tuple(QtGui.QBrush, QtGui.QBrush)
+    """
+
+    global _BRUSH_FILE, _BRUSH_MISSING
+    if _BRUSH_FILE is None:
+        _BRUSH_FILE = QtGui.QBrush(QtGui.QColor(80, 120, 110))
+        _BRUSH_MISSING = QtGui.QBrush(QtGui.QColor(195, 55, 55))
+    return _BRUSH_FILE, _BRUSH_MISSING
+
+
+@lru_cache(maxsize=4096)
+def _cached_isfile(path):
+    """
+    Memoized os.path.isfile used to color-code dependency rows.
+
+    Dependency lists repeat paths shared by several parents; caching collapses the repeated stat calls into
+    one per unique path. The cache is cleared every time the dialog is shown so a new population sees the
+    current disk state.
+
+    :param str path: Absolute file path to check.
+    :return: True if path points to an existing file; False otherwise.
+    :rtype: bool
+    """
+
+    return os.path.isfile(path)
+
+
+if qtutils.QT_AVAILABLE:
+    class _DepScanWorker(QtCore.QObject):
+        """
+        Worker that resolves dependency presence on disk away from the GUI thread.
+
+        Emits chunk_ready with lists of (item_path, parent_path, is_present) triples so the dialog can
+        insert rows in batches through a queued connection while stat calls keep running in the worker
+        thread.
+        """
+
+        chunk_ready = QtCore.Signal(list)
+        finished = QtCore.Signal()
+
+        CHUNK_SIZE = 256
+
+        def __init__(self, pairs):
+            super(_DepScanWorker, self).__init__()
+
+            self._pairs = pairs
+
+        def scan(self):
+            current_thread = QtCore.QThread.currentThread()
+            chunk = list()
+            for item_path, parent_path in self._pairs:
+                if current_thread.isInterruptionRequested():
+                    self.finished.emit()
+                    return
+                if not item_path:
+                    continue
+                chunk.append((item_path, parent_path, _cached_isfile(item_path)))
+                if len(chunk) >= self.CHUNK_SIZE:
+                    self.chunk_ready.emit(chunk)
+                    chunk = list()
+            if chunk:
+                self.chunk_ready.emit(chunk)
+            self.finished.emit()
+
+
 class DependenciesOutputDialog(dialog.Dialog(), object):
+
+    FADE_ENABLED = True
+
     def __init__(self, parent=None, **kwargs):
+
+        self._path_to_item = dict()
+        self._pending_children = dict()
+        self._scan_thread = None
+        self._scan_worker = None
+        self._scan_generation = 0
+
         super(DependenciesOutputDialog, self).__init__(parent, **kwargs)
 
+    @classmethod
+    def get_or_create(cls, parent=None):
+        """
+        Returns the process-wide dialog instance, creating it on first use.
+
+        The instance is held through a weak reference, so it is rebuilt transparently if Qt deleted the
+        previous one. On reuse the model and the per-path caches are cleared, which keeps repeated Get
+        Dependencies runs from paying widget construction and stylesheet setup every time.
+
+        :param QtWidgets.QWidget or None parent: Parent widget used when a new dialog must be created.
+        :return: Shared dependencies output dialog instance.
+        :rtype: DependenciesOutputDialog
+        """
+
+        global _DIALOG_REF
+
+        dialog_instance = _DIALOG_REF() if _DIALOG_REF is not None else None
+        if dialog_instance is None:
+            dialog_instance = cls(parent=parent)
+            _DIALOG_REF = weakref.ref(dialog_instance)
+        else:
+            dialog_instance.reset()
+
+        return dialog_instance
+
+    def reset(self):
+        """
+        Clears the tree model and all per-population caches so the dialog can be reused for a new run.
+        """
+
+        self._stop_scan()
+        self._deps_model.removeRows(0, self._deps_model.rowCount())
+        self._path_to_item = dict()
+        self._pending_children = dict()
+        _cached_isfile.cache_clear()
+
     def get_main_layout(self):
         main_layout = QtWidgets.QVBoxLayout()
         main_layout.setContentsMargins(2, 2, 2, 2)
@@ -33,8 +160,11 @@ class DependenciesOutputDialog(dialog.Dialog(), object):
         self.setWindowTitle('Get Dependencies Result')
 
         deps_lbl = QtWidgets.QLabel('Attempting to retrieve the following dependencies: ')
-        self._deps_tree = QtWidgets.QTreeWidget()
-        self._deps_tree.setHeaderLabels(['Dependency Path'])
+        self._deps_model = QtGui.QStandardItemModel()
+        self._deps_model.setHorizontalHeaderLabels(['Dependency Path'])
+        self._deps_tree = QtWidgets.QTreeView()
+        self._deps_tree.setModel(self._deps_model)
+        self._deps_tree.setUniformRowHeights(True)
 
         button_layout = QtWidgets.QHBoxLayout()
         self._ok_btn = QtWidgets.QPushButton('Ok')
@@ -47,35 +177,204 @@ class DependenciesOutputDialog(dialog.Dialog(), object):
         self.main_layout.addLayout(button_layout)
 
         self._ok_btn.clicked.connect(self._on_ok)
+        self._deps_tree.expanded.connect(self._on_item_expanded)
 
         self.resize(QtCore.QSize(350, 350))
 
     def showEvent(self, event):
-        self._deps_tree.expandAll()
+        _cached_isfile.cache_clear()
         super(DependenciesOutputDialog, self).showEvent(event)
 
-    def add_dependency(self, item_path, parent_path):
+    def begin_bulk(self):
+        """
+        Prepares the tree for a bulk population, suspending repaints and signal emission until end_bulk
+        is called.
+        """
+
+        self._deps_tree.setUpdatesEnabled(False)
+        self._deps_tree.blockSignals(True)
+
+    def end_bulk(self):
+        """
+        Restores tree updates after a bulk population.
+        """
+
+        self._deps_tree.blockSignals(False)
+        self._deps_tree.setUpdatesEnabled(True)
+
+    def add_dependencies(self, pairs):
+        """
+        Adds all the given (dependency path, parent path) pairs into the tree in one batch, suspending
+        repaints and signal emission so the tree lays itself out once instead of once per item.
+
+        Each entry is a (dependency path, parent path) pair, optionally extended with a third boolean
+        telling whether the dependency exists on disk, which skips the stat call on the GUI thread.
+
+        Only top-level parent items are created up front; their children are kept as raw data and
+        materialized into model items the first time the parent row is expanded.
+
+        :param list(tuple(str, str or None)) pairs: List of dependency path / parent path pairs to add.
+        """
+
+        self.begin_bulk()
+        try:
+            children_by_parent = dict()
+            parent_order = list()
+            for pair in pairs:
+                item_path, parent_path = pair[0], pair[1]
+                if not item_path:
+                    continue
+                is_present = pair[2] if len(pair) > 2 else None
+                if parent_path not in children_by_parent:
+                    children_by_parent[parent_path] = list()
+                    parent_order.append(parent_path)
+                children_by_parent[parent_path].append((item_path, is_present))
+            root_item = self._deps_model.invisibleRootItem()
+            for parent_path in parent_order:
+                raw_children = children_by_parent[parent_path]
+                if not parent_path:
+                    root_item.appendRows([self._create_item(path, present) for path, present in raw_children])
+                    continue
+                parent_item = self._path_to_item.get(parent_path, None)
+                if parent_item is None:
+                    parent_item = self._create_item(parent_path)
+                    root_item.appendRow(parent_item)
+                if parent_path in self._pending_children:
+                    self._pending_children[parent_path].extend(raw_children)
+                elif parent_item.rowCount():
+                    parent_item.appendRows([self._create_item(path, present) for path, present in raw_children])
+                else:
+                    self._pending_children[parent_path] = raw_children
+                    placeholder_item = QtGui.QStandardItem('')
+                    placeholder_item.setEditable(False)
+                    parent_item.appendRow(placeholder_item)
+        finally:
+            self.end_bulk()
+
+    def _on_item_expanded(self, index):
+        """
+        Internal callback function that materializes the pending children of an item the first time it
+        is expanded, replacing the placeholder row that made the item expandable.
+
+        :param QtCore.QModelIndex index: Model index of the expanded item.
+        """
+
+        expanded_item = self._deps_model.itemFromIndex(index)
+        if expanded_item is None:
+            return
+        raw_children = self._pending_children.pop(expanded_item.text(), None)
+        if raw_children is None:
+            return
+        expanded_item.removeRows(0, expanded_item.rowCount())
+        expanded_item.appendRows([self._create_item(path, present) for path, present in raw_children])
+
+    def populate_async(self, pairs):
+        """
+        Populates the tree from a worker thread, keeping the GUI responsive for large dependency sets.
+
+        The isfile checks run inside the worker and rows arrive in chunks through a queued signal, so the
+        dialog can be shown immediately while the tree fills itself in.
+
+        :param list(tuple(str, str or None)) pairs: List of dependency path / parent path pairs to add.
+        """
+
+        self._stop_scan()
+        scan_generation = self._scan_generation
+        self._scan_thread = QtCore.QThread(self)
+        self._scan_worker = _DepScanWorker(list(pairs))
+        self._scan_worker.moveToThread(self._scan_thread)
+        self._scan_thread.started.connect(self._scan_worker.scan)
+        self._scan_worker.chunk_ready.connect(
+            lambda triples, generation=scan_generation: self._on_scan_chunk(generation, triples),
+            QtCore.Qt.QueuedConnection)
+        self._scan_worker.finished.connect(self._scan_thread.quit)
+        self._scan_worker.finished.connect(self._scan_worker.deleteLater)
+        self._scan_thread.finished.connect(self._scan_thread.deleteLater)
+        self._scan_thread.start()
+
+    def _stop_scan(self):
+        """
+        Internal function that stops the in-flight population scan, if any, and invalidates its chunks.
+
+        Bumping the generation counter makes chunks already queued in the event loop land in
+        _on_scan_chunk as stale and be discarded, so a new population (or a reset) never receives rows
+        from a previous run.
+        """
+
+        self._scan_generation += 1
+        scan_thread = self._scan_thread
+        self._scan_thread = None
+        self._scan_worker = None
+        if scan_thread is None:
+            return
+        try:
+            scan_thread.requestInterruption()
+            scan_thread.quit()
+            scan_thread.wait()
+        except RuntimeError:
+            # The thread finished earlier and was already deleted through deleteLater.
+            pass
+
+    def _on_scan_chunk(self, scan_generation, triples):
+        """
+        Internal callback function that inserts a chunk produced by the scan worker, dropping chunks
+        queued by a scan that has been superseded since.
+
+        :param int scan_generation: Generation counter value of the scan that produced the chunk.
+        :param list(tuple(str, str or None, bool)) triples: Chunk of dependency rows to insert.
+        """
+
+        if scan_generation != self._scan_generation:
+            return
+        self.add_dependencies(triples)
+
+    def _create_item(self, item_path, is_present=None):
+        """
+        Internal function that creates and registers the model item for the given dependency path.
+
+        :param str item_path: Dependency file path the item represents.
+        :param bool or None is_present: Whether the path exists on disk, if already known; when None the
+            check is resolved (and cached) here.
+        :return: Newly created model item.
+        :rtype: QtGui.QStandardItem
+        """
+
+        if is_present is None:
+            is_present = _cached_isfile(item_path)
+        file_brush, missing_brush = _row_brushes()
+        new_item = QtGui.QStandardItem(item_path)
+        new_item.setEditable(False)
+        new_item.setBackground(file_brush if is_present else missing_brush)
+        self._path_to_item.setdefault(item_path, new_item)
+
+        return new_item
+
+    def add_dependency(self, item_path, parent_path, is_present=None):
+        """
+        Adds a single dependency row into the tree.
+
+        :param str item_path: Dependency file path the row represents.
+        :param str or None parent_path: Path of the parent dependency, or None for a top-level row.
+        :param bool or None is_present: Whether the path exists on disk, if the caller already knows;
+            when None the check is resolved (and cached) here.
+        """
+
         if not item_path:
             return
 
-        new_item = QtWidgets.QTreeWidgetItem()
-        new_item.setText(0, item_path)
-        if os.path.isfile(item_path):
-            new_item.setBackgroundColor(0, QtGui.QColor(80, 120, 110))
-        else:
-            new_item.setBackgroundColor(0, QtGui.QColor(195, 55, 55))
+        new_item = self._create_item(item_path, is_present)
         if not parent_path:
-            self._deps_tree.addTopLevelItem(new_item)
+            self._deps_model.invisibleRootItem().appendRow(new_item)
         else:
-            parent_item = self._deps_tree.findItems(parent_path, QtCore.Qt.MatchExactly)
-            if not parent_item:
+            parent_item = self._path_to_item.get(parent_path, None)
+            if parent_item is None:
                 parent_item = self.add_dependency(parent_path, None)
-                parent_item.addChild(new_item)
-            else:
-                parent_item = parent_item[0]
-                parent_item.addChild(new_item)
+            parent_item.appendRow(new_item)
 
         return new_item
 
     def _on_ok(self):
-        self.fade_close()
+        if self.FADE_ENABLED and not getattr(self, '_fast_close', False):
+            self.fade_close()
+        else:
+            self.close()